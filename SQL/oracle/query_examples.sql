@@ -9,8 +9,8 @@ SELECT fa.FA_BUp
 FROM FUEL_ASSEMBLY fa
 JOIN REACTOR_DESIGN rd ON fa.reactor_design_id = rd.id
 JOIN PLANTS p ON fa.plant_id = p.id
-JOIN REACTOR_LOCATIONS rl ON p.reactor_location_id = rl.id
-WHERE rl.reactor_location = 'Auvergne-Rhône-Alpes'
+JOIN LOCATIONS l ON p.location_id = l.id
+WHERE l.location = 'Auvergne-Rhône-Alpes'
   AND rd.reactor_type = 'CPY';
 
 -- Query 3: Get the max and min BUp for the above selection
@@ -18,8 +18,8 @@ SELECT MAX(fa.FA_BUp) AS max_bup, MIN(fa.FA_BUp) AS min_bup
 FROM FUEL_ASSEMBLY fa
 JOIN REACTOR_DESIGN rd ON fa.reactor_design_id = rd.id
 JOIN PLANTS p ON fa.plant_id = p.id
-JOIN REACTOR_LOCATIONS rl ON p.reactor_location_id = rl.id
-WHERE rl.reactor_location = 'Auvergne-Rhône-Alpes'
+JOIN LOCATIONS l ON p.location_id = l.id
+WHERE l.location = 'Auvergne-Rhône-Alpes'
   AND rd.reactor_type = 'CPY';
 
 -- Query 4: Number of FUEL_ASSEMBLY that are in VD3 epoch and on 1450 MWe core designs
@@ -32,10 +32,10 @@ WHERE e.epoch = 'VD3'
 
 -- Query 5: List all 1300 MWe plants in the three/four northernmost French regions
 -- (Assuming regions: 'Hauts-de-France', 'Île-de-France', 'Normandy', 'Grand Est')
-SELECT DISTINCT p.plant_name, rl.reactor_location
+SELECT DISTINCT p.plant_name, l.location
 FROM PLANTS p
-JOIN REACTOR_LOCATIONS rl ON p.reactor_location_id = rl.id
+JOIN LOCATIONS l ON p.location_id = l.id
 JOIN FUEL_ASSEMBLY fa ON fa.plant_id = p.id
 JOIN REACTOR_DESIGN rd ON fa.reactor_design_id = rd.id
 WHERE rd.reactor_power = 1300
-  AND rl.reactor_location IN ('Hauts-de-France', 'Île-de-France', 'Normandy', 'Grand Est');
+  AND l.location IN ('Hauts-de-France', 'Île-de-France', 'Normandy', 'Grand Est');
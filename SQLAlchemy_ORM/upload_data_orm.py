@@ -1,7 +1,7 @@
 import pandas as pd
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from create_tables_orm import ReactorLocation, Epoch, ReactorDesign, Plant, FuelAssembly
+from create_tables_orm import Base, ReactorLocation, Epoch, ReactorDesign, Plant, FuelAssembly
 from pathlib import Path
 from typing import Dict, Tuple
 
@@ -12,6 +12,7 @@ df = pd.read_csv(DATA_PATH)
 # Create SQLite session
 DB_PATH = Path(__file__).parent / 'example_orm.db'
 engine = create_engine(f'sqlite:///{DB_PATH}')
+Base.metadata.create_all(engine)  # no-op when create_tables_orm.py has already created the tables
 Session = sessionmaker(bind=engine)
 session = Session()
 
@@ -31,8 +32,8 @@ design_map: Dict[Tuple[int, str], int] = {
     for idx in df.drop_duplicates(['reactor_power_MWe', 'reactor_type_code']).index
 }
 plant_map: Dict[Tuple[str, str], int] = {
-    (str(df.at[idx, 'plant_code']), str(df.at[idx, 'region'])): idx + 1
-    for idx in df.drop_duplicates(['plant_code', 'region']).index
+    (str(df.at[idx, 'plant_name']), str(df.at[idx, 'region'])): idx + 1
+    for idx in df.drop_duplicates(['plant_name', 'region']).index
 }
 
 # Insert data into tables
@@ -52,7 +53,7 @@ for _, row in df.iterrows():
         FA_manufacturing_year=row.at['FA_year_made'],
         FA_BUp=row.at['burnup_GWd_tU'],
         reactor_design_id=design_map[(int(row.at['reactor_power_MWe']), str(row.at['reactor_type_code']))],
-        plant_id=plant_map[(str(row.at['plant_code']), str(row.at['region']))],
+        plant_id=plant_map[(str(row.at['plant_name']), str(row.at['region']))],
         epoch_id=epoch_map[str(row.at['epoch_label'])],
         introduction_year=row.at['FA_year_intro']
     ))
@@ -46,14 +46,15 @@ fuel_assembly = Table(
     Column("introduction_year", Integer, nullable=False)
 )
 
-# Print the CREATE TABLE statements for all tables for SQLite3
-print("-- SQLite3 DDL --")
-for table in [reactor_locations, epochs, reactor_design, plants, fuel_assembly]:
-    print(str(CreateTable(table).compile(dialect=sqlite.dialect())))
-    print()
-
-# Print the CREATE TABLE statements for all tables for Oracle
-print("\n-- Oracle DDL --")
-for table in [reactor_locations, epochs, reactor_design, plants, fuel_assembly]:
-    print(str(CreateTable(table).compile(dialect=oracle.dialect())))
-    print()
+if __name__ == "__main__":
+    # Print the CREATE TABLE statements for all tables for SQLite3
+    print("-- SQLite3 DDL --")
+    for table in [reactor_locations, epochs, reactor_design, plants, fuel_assembly]:
+        print(str(CreateTable(table).compile(dialect=sqlite.dialect())))
+        print()
+
+    # Print the CREATE TABLE statements for all tables for Oracle
+    print("\n-- Oracle DDL --")
+    for table in [reactor_locations, epochs, reactor_design, plants, fuel_assembly]:
+        print(str(CreateTable(table).compile(dialect=oracle.dialect())))
+        print()
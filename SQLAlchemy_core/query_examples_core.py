@@ -80,7 +80,7 @@ df = pd.read_csv(DATA_PATH)
 loc_map = {loc: i+1 for i, loc in enumerate(df['region'].unique())}
 epoch_map = {ep: i+1 for i, ep in enumerate(df['epoch_label'].unique())}
 design_map = {(row['reactor_power_MWe'], row['reactor_type_code']): i+1 for i, row in df.drop_duplicates(['reactor_power_MWe','reactor_type_code']).iterrows()}
-plant_map = {(row['plant_code'], row['region']): i+1 for i, row in df.drop_duplicates(['plant_code','region']).iterrows()}
+plant_map = {(row['plant_name'], row['region']): i+1 for i, row in df.drop_duplicates(['plant_name','region']).iterrows()}
 
 # Insert into lookup tables
 with engine.begin() as conn:
@@ -101,7 +101,7 @@ with engine.begin() as conn:
             FA_manufacturing_year=row['FA_year_made'],
             FA_BUp=row['burnup_GWd_tU'],
             reactor_design_id=design_map[(row['reactor_power_MWe'], row['reactor_type_code'])],
-            plant_id=plant_map[(row['plant_code'], row['region'])],
+            plant_id=plant_map[(row['plant_name'], row['region'])],
             epoch_id=epoch_map[row['epoch_label']],
             introduction_year=row['FA_year_intro']
         ))
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+from query_registry.query_specs import QUERY_SPECS
+from query_registry.run_queries_parallel import BASE_DIR, run_backend, canonical_rows, load_sqlite_connection
+
+# ---
+# PEDAGOGICAL NOTE: The hand-written copies of the example queries are kept as teaching material
+# (one idiomatic version per technology), but they must not drift from the query registry.
+# This check compares each query found in a copy with the QUERY_SPECS query of the same name and reports every
+# disagreement (registry queries without a hand-written copy are fine):
+#   - the pandas, SQLAlchemy Core and ORM scripts are run unchanged, then their query variables are read back;
+#   - the SQLite SQL file is executed statement by statement on the normalized SQLite database;
+#   - the Oracle SQL file cannot run here, so its table and column references are checked against the Oracle DDL.
+# Run from the project root: python -m query_registry.check_query_copies
+# ---
+
+# Hand-written Python copies: scripts to run first (e.g. to load the database), then the script holding the queries
+SCRIPT_COPIES = {
+    "pandas": ([], Path('pandas/query_examples_pandas.py')),
+    "core": ([], Path('SQLAlchemy_core/query_examples_core.py')),
+    "orm": ([Path('SQLAlchemy_ORM/upload_data_orm.py')], Path('SQLAlchemy_ORM/query_data_orm.py')),
+}
+
+
+def _core_rows(script_globals: dict, statement: str):
+    with script_globals['engine'].connect() as conn:  # in-memory SQLite: same thread, same connection and data
+        return conn.execute(script_globals[statement]).all()
+
+
+# For each copy, the queries it contains and how to read their rows from the script's variables once it has run
+COPY_QUERIES = {
+    "pandas": {
+        "Query 1": lambda g: g['fa_900'].to_frame().values.tolist(),
+        "Query 2": lambda g: g['bup_cpy_auvergne'].to_frame().values.tolist(),
+        "Query 3": lambda g: [[g['bup_cpy_auvergne'].max(), g['bup_cpy_auvergne'].min()]],
+        "Query 4": lambda g: [[g['count_vd3_1450']]],
+        "Query 5": lambda g: g['plants_1300'].values.tolist(),
+    },
+    "core": {
+        "Query 1": lambda g: _core_rows(g, 'q1'),
+        "Query 2": lambda g: _core_rows(g, 'q2'),
+        "Query 3": lambda g: _core_rows(g, 'q3'),
+        "Query 4": lambda g: [[len(_core_rows(g, 'q4'))]],  # the script counts the selected rows
+        "Query 5": lambda g: _core_rows(g, 'q5'),
+    },
+    "orm": {f"Query {n}": lambda g, n=n: g[f'q{n}'].all() for n in range(1, 6)},
+}
+SQLITE_QUERIES_PATH = BASE_DIR / 'SQL' / 'sqlite3' / 'query_examples.sql'
+ORACLE_QUERIES_PATH = BASE_DIR / 'SQL' / 'oracle' / 'query_examples.sql'
+ORACLE_DDL_PATH = BASE_DIR / 'SQL' / 'oracle' / 'create_fuel_assembly_oracle.sql'
+
+
+# Function to split a query_examples.sql file into {"Query n": statement} using its "-- Query n:" comments
+def split_sql_queries(path: Path) -> Dict[str, str]:
+    blocks = re.split(r'^-- (Query \d+):.*$', path.read_text(encoding='utf-8'), flags=re.MULTILINE)
+    return {name: statement.strip() for name, statement in zip(blocks[1::2], blocks[2::2])}
+
+
+# Function to run a script copy in this process and write the rows of its queries as JSON (see --run-copy below)
+def dump_copy_results(copy: str, output: Path) -> None:
+    _, script = SCRIPT_COPIES[copy]
+    script_globals = runpy.run_path(str(BASE_DIR / script), run_name="__main__")
+    results = {name: [list(row) for row in read(script_globals)] for name, read in COPY_QUERIES[copy].items()}
+    output.write_text(json.dumps(results, default=lambda value: value.item()), encoding='utf-8')
+
+
+# Function to run a hand-written script copy and return its results as {"Query n": canonical rows}.
+# Each copy runs in its own process, with its folder on the path as when the script is run directly.
+def run_script_copy(copy: str) -> Dict[str, List[Tuple]]:
+    prerequisites, script = SCRIPT_COPIES[copy]
+    for prerequisite in prerequisites:
+        result = subprocess.run([sys.executable, str(BASE_DIR / prerequisite)], capture_output=True, text=True, cwd=BASE_DIR)
+        if result.returncode != 0:
+            raise RuntimeError(f"{prerequisite} failed:\n{result.stderr}")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(BASE_DIR / script.parent), os.environ.get('PYTHONPATH')])))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dump_path = Path(tmp_dir) / 'results.json'
+        command = [sys.executable, '-m', 'query_registry.check_query_copies', '--run-copy', copy, str(dump_path)]
+        result = subprocess.run(command, capture_output=True, text=True, cwd=BASE_DIR, env=env)
+        if result.returncode != 0:
+            raise RuntimeError(f"{script} failed:\n{result.stderr}")
+        dumped = json.loads(dump_path.read_text(encoding='utf-8'))
+    return {name: canonical_rows(rows) for name, rows in dumped.items()}
+
+
+# Function to run the SQLite query file on the normalized SQLite database
+def run_sqlite_copy() -> Dict[str, List[Tuple]]:
+    conn = load_sqlite_connection()
+    try:
+        return {name: canonical_rows(conn.execute(statement).fetchall())
+                for name, statement in split_sql_queries(SQLITE_QUERIES_PATH).items()}
+    finally:
+        conn.close()
+
+
+# Function to check that the Oracle queries only reference tables and columns created by the Oracle DDL
+def check_oracle_references() -> List[str]:
+    ddl = ORACLE_DDL_PATH.read_text(encoding='utf-8')
+    columns = {
+        table.upper(): {line.split()[0].upper() for line in body.splitlines()
+                        if line.strip() and not line.strip().upper().startswith('CONSTRAINT')}
+        for table, body in re.findall(r'CREATE TABLE (\w+) \((.*?)\n\);', ddl, flags=re.DOTALL)
+    }
+    problems = []
+    for name, statement in split_sql_queries(ORACLE_QUERIES_PATH).items():
+        aliases = {}
+        for table, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(\w+))?', statement):
+            if table.upper() not in columns:
+                problems.append(f"Oracle {name}: table {table} is not created by {ORACLE_DDL_PATH.name}")
+            aliases[(alias or table).upper()] = table.upper()
+        for alias, column in re.findall(r'\b(\w+)\.(\w+)\b', statement):
+            table = aliases.get(alias.upper())
+            if table in columns and column.upper() not in columns[table]:
+                problems.append(f"Oracle {name}: column {table}.{column} is not created by {ORACLE_DDL_PATH.name}")
+    return problems
+
+
+# Function to compare every hand-written copy with the query registry; returns the list of disagreements
+def check_copies() -> List[str]:
+    expected = run_backend("pandas", QUERY_SPECS, repeat=0)["results"]
+    with ThreadPoolExecutor(max_workers=len(SCRIPT_COPIES) + 1) as executor:
+        futures = {copy: executor.submit(run_script_copy, copy) for copy in SCRIPT_COPIES}
+        futures["sqlite SQL file"] = executor.submit(run_sqlite_copy)
+        copies = {copy: future.result() for copy, future in futures.items()}
+
+    # Only the queries a copy actually contains are compared: a new QuerySpec does not need four new copies
+    problems = []
+    for copy, results in copies.items():
+        for name, actual in results.items():
+            if name not in expected:
+                problems.append(f"{copy}: {name} is not in the registry")
+            elif actual != expected[name]:
+                problems.append(
+                    f"{copy}: {name} returned {len(actual)} rows, the registry returns {len(expected[name])}"
+                    f" (first rows: {actual[:3]} vs {expected[name][:3]})"
+                )
+    return problems + check_oracle_references()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the hand-written query copies against the query registry.")
+    parser.add_argument("--run-copy", nargs=2, metavar=("COPY", "OUTPUT"), help="internal: run one script copy and write its results")
+    args = parser.parse_args()
+    if args.run_copy:
+        dump_copy_results(args.run_copy[0], Path(args.run_copy[1]))
+        sys.exit(0)
+
+    problems = check_copies()
+    if problems:
+        print("[ERROR] Hand-written query copies disagree with query_registry/query_specs.py:")
+        for problem in problems:
+            print(" -", problem)
+        sys.exit(1)
+    print("[INFO] pandas, Core, ORM, SQLite and Oracle query copies all match the registry queries.")
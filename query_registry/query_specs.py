@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import pandas as pd
+from sqlalchemy import Table, select, and_, func
+from sqlalchemy.dialects import sqlite
+from SQLAlchemy_core.fuel_assembly_core_demo_full import (
+    metadata, reactor_locations, epochs, reactor_design, plants, fuel_assembly
+)
+from SQLAlchemy_ORM.create_tables_orm import FuelAssembly, ReactorDesign, Plant, ReactorLocation, Epoch
+
+# ---
+# PEDAGOGICAL NOTE: One declarative definition per query.
+# The same five example queries used to be written four times (pandas, SQLite SQL, SQLAlchemy Core, ORM)
+# and the copies drifted apart. Here each query is described once, with logical attribute names, and is
+# compiled to a pandas expression, a Core statement (also rendered as plain SQLite SQL) and an ORM query.
+# Adding a query means adding one QuerySpec to QUERY_SPECS. The schema is not redefined here: the Core tables come
+# from SQLAlchemy_core/fuel_assembly_core_demo_full.py and the ORM models from SQLAlchemy_ORM/create_tables_orm.py.
+# Run from the project root as a module, e.g. `python -m query_registry.run_queries_parallel`.
+# ---
+
+# Logical attribute → (CSV column, normalized table, column in that table)
+ATTRIBUTES: Dict[str, Tuple[str, str, str]] = {
+    "FA_name": ("FA_name", "FUEL_ASSEMBLY", "FA_name"),
+    "FA_BUp": ("burnup_GWd_tU", "FUEL_ASSEMBLY", "FA_BUp"),
+    "FA_mass": ("FA_mass_kg", "FUEL_ASSEMBLY", "FA_mass"),
+    "introduction_year": ("FA_year_intro", "FUEL_ASSEMBLY", "introduction_year"),
+    "reactor_power": ("reactor_power_MWe", "REACTOR_DESIGN", "reactor_power"),
+    "reactor_type": ("reactor_type_code", "REACTOR_DESIGN", "reactor_type"),
+    "plant_name": ("plant_name", "PLANTS", "plant_name"),
+    "region": ("region", "REACTOR_LOCATIONS", "reactor_location"),
+    "epoch": ("epoch_label", "EPOCHS", "epoch"),
+}
+
+CORE_TABLES: Dict[str, Table] = {table.name: table for table in metadata.sorted_tables}
+ORM_MODELS = {
+    "FUEL_ASSEMBLY": FuelAssembly,
+    "REACTOR_DESIGN": ReactorDesign,
+    "PLANTS": Plant,
+    "REACTOR_LOCATIONS": ReactorLocation,
+    "EPOCHS": Epoch,
+}
+
+# Joins from FUEL_ASSEMBLY, in the order they must be applied: (table, table it hangs on, Core onclause, ORM relationship)
+JOINS = [
+    ("REACTOR_DESIGN", None, fuel_assembly.c.reactor_design_id == reactor_design.c.id, FuelAssembly.reactor_design),
+    ("PLANTS", None, fuel_assembly.c.plant_id == plants.c.id, FuelAssembly.plant),
+    ("REACTOR_LOCATIONS", "PLANTS", plants.c.reactor_location_id == reactor_locations.c.id, Plant.reactor_location),
+    ("EPOCHS", None, fuel_assembly.c.epoch_id == epochs.c.id, FuelAssembly.epoch),
+]
+
+# Supported filter operators and aggregate functions
+OPERATORS = ("==", "in", ">=", "<=")
+AGGREGATES = ("max", "min", "count")
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """Declarative description of a query, independent of the backend.
+
+    ``columns`` and ``filters`` use the logical names of ``ATTRIBUTES``. A filter is an
+    ``(attribute, operator, value)`` triple; an aggregate is a ``(function, attribute, label)``
+    triple (the attribute is ignored by ``count``). A spec either selects ``columns`` or
+    computes ``aggregates``.
+    """
+    name: str
+    description: str
+    columns: Tuple[str, ...] = ()
+    filters: Tuple[Tuple[str, str, object], ...] = ()
+    aggregates: Tuple[Tuple[str, str, str], ...] = ()
+    distinct: bool = False
+
+    @property
+    def output_names(self) -> List[str]:
+        return [label for _, _, label in self.aggregates] if self.aggregates else list(self.columns)
+
+    def attributes(self) -> List[str]:
+        return list(self.columns) + [attr for attr, _, _ in self.filters] + [attr for _, attr, _ in self.aggregates]
+
+
+NORTHERN_REGIONS = ('Hauts-de-France', 'Île-de-France', 'Normandy', 'Grand Est')
+ARA_CPY = (("region", "==", "Auvergne-Rhône-Alpes"), ("reactor_type", "==", "CPY"))
+
+QUERY_SPECS: List[QuerySpec] = [
+    QuerySpec(
+        name="Query 1",
+        description="FA_name in 900 MWe reactors",
+        columns=("FA_name",),
+        filters=(("reactor_power", "==", 900),),
+    ),
+    QuerySpec(
+        name="Query 2",
+        description="BUp in Auvergne-Rhône-Alpes and CPY design",
+        columns=("FA_BUp",),
+        filters=ARA_CPY,
+    ),
+    QuerySpec(
+        name="Query 3",
+        description="Max/Min BUp for Query 2",
+        filters=ARA_CPY,
+        aggregates=(("max", "FA_BUp", "max_bup"), ("min", "FA_BUp", "min_bup")),
+    ),
+    QuerySpec(
+        name="Query 4",
+        description="Number of FA in VD3 and 1450 MWe",
+        filters=(("epoch", "==", "VD3"), ("reactor_power", "==", 1450)),
+        aggregates=(("count", "FA_name", "num_fa"),),
+    ),
+    QuerySpec(
+        name="Query 5",
+        description="1300 MWe plants in northernmost regions",
+        columns=("plant_name", "region"),
+        filters=(("reactor_power", "==", 1300), ("region", "in", NORTHERN_REGIONS)),
+        distinct=True,
+    ),
+]
+
+
+# Function to check a spec against the attribute catalog, operators and aggregate functions
+def validate_spec(spec: QuerySpec) -> None:
+    if bool(spec.columns) == bool(spec.aggregates):
+        raise ValueError(f"{spec.name}: a spec must define either columns or aggregates")
+    for attr in spec.attributes():
+        if attr not in ATTRIBUTES:
+            raise ValueError(f"{spec.name}: unknown attribute '{attr}'")
+    for _, op, _ in spec.filters:
+        if op not in OPERATORS:
+            raise ValueError(f"{spec.name}: unsupported operator '{op}'")
+    for function, _, _ in spec.aggregates:
+        if function not in AGGREGATES:
+            raise ValueError(f"{spec.name}: unsupported aggregate '{function}'")
+
+
+def _apply_operator(operand, op, value):
+    if op == "==":
+        return operand == value
+    if op == ">=":
+        return operand >= value
+    if op == "<=":
+        return operand <= value
+    return operand.isin(value) if isinstance(operand, pd.Series) else operand.in_(value)
+
+
+# Function to list the tables to join (from FUEL_ASSEMBLY) for the attributes of a spec
+def _required_joins(spec: QuerySpec):
+    tables = {ATTRIBUTES[attr][1] for attr in spec.attributes()}
+    tables |= {parent for name, parent, _, _ in JOINS if name in tables and parent is not None}
+    return [join for join in JOINS if join[0] in tables]
+
+
+# Compile a spec to a pandas expression on the flat CSV DataFrame
+def to_pandas(spec: QuerySpec, df: pd.DataFrame) -> pd.DataFrame:
+    mask = pd.Series(True, index=df.index)
+    for attr, op, value in spec.filters:
+        mask &= _apply_operator(df[ATTRIBUTES[attr][0]], op, value)
+    selection = df[mask]
+    if spec.aggregates:
+        row = {}
+        for function, attr, label in spec.aggregates:
+            row[label] = len(selection) if function == "count" else getattr(selection[ATTRIBUTES[attr][0]], function)()
+        return pd.DataFrame([row])
+    result = selection[[ATTRIBUTES[attr][0] for attr in spec.columns]]
+    result.columns = list(spec.columns)
+    return result.drop_duplicates() if spec.distinct else result
+
+
+# Compile a spec to a SQLAlchemy Core SELECT statement
+def to_core(spec: QuerySpec):
+    def column(attr):
+        _, table_name, column_name = ATTRIBUTES[attr]
+        return CORE_TABLES[table_name].c[column_name]
+
+    if spec.aggregates:
+        selected = [
+            (func.count() if function == "count" else getattr(func, function)(column(attr))).label(label)
+            for function, attr, label in spec.aggregates
+        ]
+    else:
+        selected = [column(attr).label(attr) for attr in spec.columns]
+    source = fuel_assembly
+    for table_name, _, onclause, _ in _required_joins(spec):
+        source = source.join(CORE_TABLES[table_name], onclause)
+    statement = select(*selected).select_from(source)
+    if spec.filters:
+        statement = statement.where(and_(*[_apply_operator(column(attr), op, value) for attr, op, value in spec.filters]))
+    return statement.distinct() if spec.distinct else statement
+
+
+# Compile a spec to plain SQLite SQL (the Core statement rendered with literal values)
+def to_sqlite_sql(spec: QuerySpec) -> str:
+    return str(to_core(spec).compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+# Compile a spec to an ORM query bound to the given session
+def to_orm(spec: QuerySpec, session):
+    def attribute(attr):
+        _, table_name, column_name = ATTRIBUTES[attr]
+        return getattr(ORM_MODELS[table_name], column_name)
+
+    if spec.aggregates:
+        selected = [
+            (func.count(FuelAssembly.id) if function == "count" else getattr(func, function)(attribute(attr))).label(label)
+            for function, attr, label in spec.aggregates
+        ]
+    else:
+        selected = [attribute(attr).label(attr) for attr in spec.columns]
+    query = session.query(*selected).select_from(FuelAssembly)
+    for _, _, _, relationship in _required_joins(spec):
+        query = query.join(relationship)
+    if spec.filters:
+        query = query.filter(and_(*[_apply_operator(attribute(attr), op, value) for attr, op, value in spec.filters]))
+    return query.distinct() if spec.distinct else query
+
+
+for _spec in QUERY_SPECS:
+    validate_spec(_spec)
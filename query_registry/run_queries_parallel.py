@@ -0,0 +1,218 @@
+import argparse
+import math
+import sqlite3
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+import pandas as pd
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from query_registry.query_specs import (
+    QUERY_SPECS, QuerySpec, metadata, CORE_TABLES, ORM_MODELS, to_pandas, to_core, to_sqlite_sql, to_orm
+)
+from SQLAlchemy_ORM.create_tables_orm import Base
+
+# ---
+# PEDAGOGICAL NOTE: The same query set, run concurrently on every backend and cross-checked.
+# Each backend loads the data its own way (flat CSV for pandas, normalized in-memory databases for
+# SQLite/Core/ORM), then runs every QuerySpec of query_specs.py. Backends run in parallel in a thread
+# (or process) pool and their results must agree. Latencies measured in that concurrent run are mostly
+# contention (e.g. for the GIL in a thread pool), so each backend is then timed again on its own: one warm-up
+# run per query, then the median of --repeat runs.
+# Run from the project root: python -m query_registry.run_queries_parallel [--pool process] [--repeat N]
+# ---
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_PATH = BASE_DIR / 'data' / 'plants_data.csv'
+SQLITE_DDL_PATH = BASE_DIR / 'SQL' / 'sqlite3' / 'create_fuel_assembly_sqlite3.sql'
+
+BACKENDS = ("pandas", "sqlite", "core", "orm")
+DEFAULT_REPEAT = 5  # timed runs per query; the reported latency is their median
+FLOAT_DIGITS = 6  # floats are rounded before comparison (SQL engines and pandas may differ in the last bits)
+
+
+# Function to normalize the denormalized CSV into records for each table of the normalized schema
+def normalize_csv(df: pd.DataFrame) -> Dict[str, List[dict]]:
+    loc_map = {loc: i + 1 for i, loc in enumerate(df['region'].unique())}
+    epoch_map = {ep: i + 1 for i, ep in enumerate(df['epoch_label'].unique())}
+    designs = df[['reactor_power_MWe', 'reactor_type_code']].drop_duplicates().itertuples(index=False)
+    design_map = {(int(power), typ): i + 1 for i, (power, typ) in enumerate(designs)}
+    plant_rows = df[['plant_name', 'region']].drop_duplicates().itertuples(index=False)
+    plant_map = {(name, region): i + 1 for i, (name, region) in enumerate(plant_rows)}
+    return {
+        "REACTOR_LOCATIONS": [{"id": i, "reactor_location": loc} for loc, i in loc_map.items()],
+        "EPOCHS": [{"id": i, "epoch": ep} for ep, i in epoch_map.items()],
+        "REACTOR_DESIGN": [
+            {"id": i, "reactor_power": power, "reactor_type": typ} for (power, typ), i in design_map.items()
+        ],
+        "PLANTS": [
+            {"id": i, "plant_name": name, "reactor_location_id": loc_map[region]} for (name, region), i in plant_map.items()
+        ],
+        "FUEL_ASSEMBLY": [
+            {
+                "id": i + 1,
+                "FA_name": row.FA_name,
+                "FA_mass": float(row.FA_mass_kg),
+                "FA_length_ft": int(row.FA_length_ft),
+                "FA_manufacturing_year": int(row.FA_year_made),
+                "FA_BUp": float(row.burnup_GWd_tU),
+                "reactor_design_id": design_map[(int(row.reactor_power_MWe), row.reactor_type_code)],
+                "plant_id": plant_map[(row.plant_name, row.region)],
+                "epoch_id": epoch_map[row.epoch_label],
+                "introduction_year": int(row.FA_year_intro),
+            }
+            for i, row in enumerate(df.itertuples(index=False))
+        ],
+    }
+
+
+# Function to turn any backend result into a comparable, order-independent list of tuples
+def canonical_rows(rows) -> List[Tuple]:
+    def canonical(value):
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return None
+        if isinstance(value, float):
+            return round(value, FLOAT_DIGITS)
+        return value.item() if hasattr(value, "item") else value
+
+    return sorted((tuple(canonical(value) for value in row) for row in rows), key=repr)
+
+
+# Function to build an in-memory SQLite database from the hand-written DDL, loaded with the normalized CSV
+def load_sqlite_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SQLITE_DDL_PATH.read_text(encoding='utf-8'))
+    for table_name, records in normalize_csv(pd.read_csv(DATA_PATH)).items():
+        columns = list(records[0])
+        conn.executemany(
+            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [tuple(record[column] for column in columns) for record in records]
+        )
+    return conn
+
+
+# Each loader prepares the backend for the given specs and returns a function running one QuerySpec and
+# returning its rows, and a function releasing the backend connections (they must be closed by the worker
+# thread that opened them).
+def _load_pandas(specs: List[QuerySpec]):
+    df = pd.read_csv(DATA_PATH)
+    return (lambda spec: to_pandas(spec, df).itertuples(index=False, name=None)), (lambda: None)
+
+
+def _load_sqlite(specs: List[QuerySpec]):
+    conn = load_sqlite_connection()
+    # The SQL is rendered once here, so that query latencies only measure sqlite3, not the SQLAlchemy compiler
+    statements = {spec.name: to_sqlite_sql(spec) for spec in specs}
+    return (lambda spec: conn.execute(statements[spec.name]).fetchall()), conn.close
+
+
+def _load_core(specs: List[QuerySpec]):
+    engine = create_engine('sqlite:///:memory:')
+    metadata.create_all(engine)
+    conn = engine.connect()
+    for table_name, records in normalize_csv(pd.read_csv(DATA_PATH)).items():
+        conn.execute(CORE_TABLES[table_name].insert(), records)
+    conn.commit()
+    return (lambda spec: conn.execute(to_core(spec)).all()), lambda: (conn.close(), engine.dispose())
+
+
+def _load_orm(specs: List[QuerySpec]):
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for table_name, records in normalize_csv(pd.read_csv(DATA_PATH)).items():
+        session.execute(insert(ORM_MODELS[table_name]), records)  # ORM bulk INSERT
+    session.commit()
+    return (lambda spec: to_orm(spec, session).all()), lambda: (session.close(), engine.dispose())
+
+
+LOADERS = {"pandas": _load_pandas, "sqlite": _load_sqlite, "core": _load_core, "orm": _load_orm}
+
+
+# Function to load one backend and run the whole query set on it (executed inside a pool worker).
+# The first run of each query is a warm-up (ORM mapper configuration, statement compilation and caching) that
+# provides the results; the latency is the median of the next `repeat` runs (no latency when repeat is 0).
+# It only returns plain Python objects, so that it can also run in a separate process.
+def run_backend(backend: str, specs: List[QuerySpec], repeat: int = DEFAULT_REPEAT) -> dict:
+    start = time.perf_counter()
+    run_query, close = LOADERS[backend](specs)
+    load_seconds = time.perf_counter() - start
+    results, latencies = {}, {}
+    try:
+        for spec in specs:
+            results[spec.name] = canonical_rows(list(run_query(spec)))
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(run_query(spec))
+                timings.append(time.perf_counter() - start)
+            if timings:
+                latencies[spec.name] = statistics.median(timings)
+    finally:
+        close()
+    return {"backend": backend, "load_seconds": load_seconds, "results": results, "latencies": latencies}
+
+
+# Function to run all backends concurrently and cross-check their results against the first backend
+def run_all(specs: List[QuerySpec] = QUERY_SPECS, backends=BACKENDS, pool: str = "thread") -> Tuple[Dict[str, dict], List[str]]:
+    executor_class = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+    with executor_class(max_workers=len(backends)) as executor:
+        futures = {backend: executor.submit(run_backend, backend, specs, 0) for backend in backends}
+        reports = {backend: future.result() for backend, future in futures.items()}
+
+    mismatches = []
+    reference = backends[0]
+    for spec in specs:
+        expected = reports[reference]["results"][spec.name]
+        for backend in backends[1:]:
+            actual = reports[backend]["results"][spec.name]
+            if actual != expected:
+                mismatches.append(
+                    f"{spec.name}: {backend} returned {len(actual)} rows, {reference} returned {len(expected)} rows"
+                    f" (first differing rows: {actual[:3]} vs {expected[:3]})"
+                )
+    return reports, mismatches
+
+
+# Function to time each backend on its own, one after the other, so that latencies are not skewed by contention
+def time_backends_alone(specs: List[QuerySpec] = QUERY_SPECS, backends=BACKENDS, repeat: int = DEFAULT_REPEAT) -> Dict[str, dict]:
+    return {backend: run_backend(backend, specs, repeat) for backend in backends}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the query set concurrently on every backend and cross-check the results.")
+    parser.add_argument("--pool", choices=("thread", "process"), default="thread", help="worker pool type")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per query, after one warm-up run")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    start = time.perf_counter()
+    reports, mismatches = run_all(pool=args.pool)
+    wall_seconds = time.perf_counter() - start
+    print(f"[INFO] Cross-check: {len(QUERY_SPECS)} queries x {len(BACKENDS)} backends concurrently in a {args.pool} pool: {wall_seconds:.2f} s wall time")
+
+    # Timings come from a separate sequential run: each backend is measured alone, without contention
+    isolated_reports = time_backends_alone(repeat=args.repeat)
+    print("\nLoad time per backend, each backend timed alone (s):")
+    print(pd.Series({backend: report["load_seconds"] for backend, report in isolated_reports.items()}).round(3).to_string())
+
+    print(f"\nQuery latency per backend, each backend timed alone (ms, median of {args.repeat} runs after a warm-up):")
+    latencies = pd.DataFrame({backend: report["latencies"] for backend, report in isolated_reports.items()}) * 1000
+    latencies.insert(0, "description", [spec.description for spec in QUERY_SPECS])
+    print(latencies.round(2).to_string())
+
+    print("\nRows per query:")
+    for spec in QUERY_SPECS:
+        rows = reports[BACKENDS[0]]["results"][spec.name]
+        print(f"{spec.name} ({', '.join(spec.output_names)}): {len(rows)} rows, e.g. {rows[:3]}")
+
+    if mismatches:
+        print("\n[ERROR] Backends disagree:")
+        for mismatch in mismatches:
+            print(" -", mismatch)
+        sys.exit(1)
+    print("\n[INFO] All backends agree on every query.")
@@ -10,12 +10,19 @@ SCRIPTS = [
     # SQLAlchemy Core scripts
     Path('SQLAlchemy_core/fuel_assembly_core_demo_full.py'),  # create core tables and data first
     Path('SQLAlchemy_core/query_examples_core.py'),  # then run core query examples
+    Path('SQLAlchemy_core/time_partitioning_core.py'),  # decade partitions and partition pruning
     # ORM scripts
     Path('SQLAlchemy_ORM/create_tables_orm.py'),
     Path('SQLAlchemy_ORM/upload_data_orm.py'),
     Path('SQLAlchemy_ORM/query_data_orm.py'),
 ]
 
+# Modules run with `python -m` from the project root (they import across project folders)
+MODULES = [
+    'query_registry.run_queries_parallel',  # same queries on pandas, SQLite, Core and ORM, cross-checked
+    'query_registry.check_query_copies',  # hand-written query copies must match the registry
+]
+
 @pytest.mark.parametrize("script_path", SCRIPTS)
 def test_script_runs(script_path):
     """Test that a script runs without error (exit code 0)."""
@@ -23,3 +30,10 @@ def test_script_runs(script_path):
     # invoke the same Python interpreter that runs pytest (ensures venv packages are available)
     result = subprocess.run([sys.executable, str(script_abs)], capture_output=True, text=True)
     assert result.returncode == 0, f"{script_path} failed with error:\n{result.stderr}"
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_module_runs(module_name):
+    """Test that a module runs without error (exit code 0) when invoked with `python -m`."""
+    project_root = Path(__file__).resolve().parent.parent
+    result = subprocess.run([sys.executable, '-m', module_name], capture_output=True, text=True, cwd=project_root)
+    assert result.returncode == 0, f"{module_name} failed with error:\n{result.stderr}"